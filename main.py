@@ -3,11 +3,12 @@ VRM Action MCP Server
 Handles different VRM model capabilities and generates appropriate actions
 """
 
-from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Union
+from functools import cache, lru_cache
+from pydantic import BaseModel, ConfigDict, Field
+from typing import TYPE_CHECKING, Any, List, Dict, Collection, FrozenSet, NamedTuple, Optional, Tuple, Union
 
-mcp = FastMCP("VRM_ActionServer")
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
 
 class VRMCapabilities(BaseModel):
     """VRM model capabilities structure"""
@@ -19,17 +20,23 @@ class VRMCapabilities(BaseModel):
 
 class BoneTransform(BaseModel):
     """Bone transformation data"""
+    model_config = ConfigDict(frozen=True)
+
     bone_name: str
-    rotation: List[float] = Field(description="Euler rotation [x, y, z] in radians")
+    rotation: Tuple[float, float, float] = Field(description="Euler rotation [x, y, z] in radians")
     position: Optional[List[float]] = Field(default=None, description="Position offset [x, y, z]")
 
 class ExpressionData(BaseModel):
     """Expression blend shape data"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     value: float = Field(ge=0.0, le=1.0, description="Expression intensity 0-1")
 
 class VRMAction(BaseModel):
     """Complete VRM action structure"""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Action name/description")
     duration: float = Field(default=1.0, description="Action duration in seconds")
     expressions: List[ExpressionData] = Field(default_factory=list)
@@ -48,42 +55,70 @@ ACTION_TEMPLATES = {
     "wave_hello": {
         "expressions": [{"name": "happy", "value": 0.7}],
         "bone_transforms": [
-            {"bone_name": "rightUpperArm", "rotation": [0, 0, -1.57]},
-            {"bone_name": "rightLowerArm", "rotation": [0, 0, -0.5]},
+            {"bone_name": "rightUpperArm", "rotation": (0, 0, -1.57)},
+            {"bone_name": "rightLowerArm", "rotation": (0, 0, -0.5)},
         ]
     },
     "dance_basic": {
         "expressions": [{"name": "happy", "value": 0.8}],
         "bone_transforms": [
-            {"bone_name": "leftUpperArm", "rotation": [0, 0, 1.0]},
-            {"bone_name": "rightUpperArm", "rotation": [0, 0, -1.0]},
-            {"bone_name": "spine", "rotation": [0, 0.3, 0]},
+            {"bone_name": "leftUpperArm", "rotation": (0, 0, 1.0)},
+            {"bone_name": "rightUpperArm", "rotation": (0, 0, -1.0)},
+            {"bone_name": "spine", "rotation": (0, 0.3, 0)},
         ]
     },
     "point_finger": {
         "bone_transforms": [
-            {"bone_name": "rightUpperArm", "rotation": [0, -0.5, -1.2]},
-            {"bone_name": "rightLowerArm", "rotation": [0, 0, -0.3]},
+            {"bone_name": "rightUpperArm", "rotation": (0, -0.5, -1.2)},
+            {"bone_name": "rightLowerArm", "rotation": (0, 0, -0.3)},
         ]
     },
     "bow": {
         "expressions": [{"name": "neutral", "value": 1.0}],
         "bone_transforms": [
-            {"bone_name": "spine", "rotation": [0.8, 0, 0]},
-            {"bone_name": "neck", "rotation": [0.3, 0, 0]},
+            {"bone_name": "spine", "rotation": (0.8, 0, 0)},
+            {"bone_name": "neck", "rotation": (0.3, 0, 0)},
         ]
     },
     "clap": {
         "expressions": [{"name": "happy", "value": 0.6}],
         "bone_transforms": [
-            {"bone_name": "rightUpperArm", "rotation": [0, -0.8, -1.0]},
-            {"bone_name": "leftUpperArm", "rotation": [0, 0.8, 1.0]},
-            {"bone_name": "rightLowerArm", "rotation": [0, 0, -1.2]},
-            {"bone_name": "leftLowerArm", "rotation": [0, 0, 1.2]},
+            {"bone_name": "rightUpperArm", "rotation": (0, -0.8, -1.0)},
+            {"bone_name": "leftUpperArm", "rotation": (0, 0.8, 1.0)},
+            {"bone_name": "rightLowerArm", "rotation": (0, 0, -1.2)},
+            {"bone_name": "leftLowerArm", "rotation": (0, 0, 1.2)},
         ]
     }
 }
 
+class _Template(NamedTuple):
+    """Flattened action template"""
+    expressions: Tuple[Tuple[str, float], ...]  # (expr_name, value)
+    bone_transforms: Tuple[Tuple[str, Tuple[float, float, float], Optional[Tuple[float, ...]]], ...]  # (bone_name, rotation, position)
+
+_NO_TEMPLATE = _Template(expressions=(), bone_transforms=())
+
+def _compile_templates() -> Dict[str, _Template]:
+    """Flatten ACTION_TEMPLATES into tuples of primitives once at import time"""
+    compiled = {}
+    for action_name, template in ACTION_TEMPLATES.items():
+        expressions = tuple(
+            (expr["name"], float(expr["value"]))
+            for expr in template.get("expressions", [])
+        )
+        bone_transforms = tuple(
+            (
+                bone["bone_name"],
+                tuple(float(r) for r in bone["rotation"]),
+                tuple(bone["position"]) if bone.get("position") is not None else None,
+            )
+            for bone in template.get("bone_transforms", [])
+        )
+        compiled[action_name] = _Template(expressions, bone_transforms)
+    return compiled
+
+_TEMPLATES = _compile_templates()
+
 STANDARD_EXPRESSIONS = [
     "neutral", "happy", "angry", "sad", "relaxed", "surprised",
     "blink", "blink_l", "blink_r", "look_up", "look_down", 
@@ -98,7 +133,80 @@ STANDARD_BONES = [
     "rightUpperLeg", "rightLowerLeg", "rightFoot"
 ]
 
-@mcp.tool()
+STANDARD_BONES_FS = frozenset(STANDARD_BONES)
+
+# Body side per standard bone: 1 = right, -1 = left, 0 = center
+_BONE_SIDE: Dict[str, int] = {
+    b: (1 if b.startswith("right") else -1 if b.startswith("left") else 0)
+    for b in STANDARD_BONES
+}
+
+# Finger bone names (3 segments per finger) per hand
+_FINGER_CANDIDATES: Dict[str, Tuple[str, ...]] = {
+    side: tuple(
+        f"{side}{finger}{i}"
+        for finger in ("Thumb", "Index", "Middle", "Ring", "Little")
+        for i in (1, 2, 3)
+    )
+    for side in ("right", "left")
+}
+
+# Rotation constraint categories used by _adapt_rotation_for_bone
+_BONE_UNCONSTRAINED = 0
+_BONE_FINGER = 1
+_BONE_NECK = 2
+_BONE_SPINE = 3
+
+@lru_cache(maxsize=256)
+def _classify_bone(bone_name: str) -> int:
+    """Constraint category for a bone, derived from its name"""
+    lowered = bone_name.lower()
+    if "finger" in lowered or "thumb" in lowered:
+        return _BONE_FINGER
+    elif "neck" in lowered:
+        return _BONE_NECK
+    elif "spine" in lowered:
+        return _BONE_SPINE
+    return _BONE_UNCONSTRAINED
+
+_BONE_CATEGORY: Dict[str, int] = {
+    bone: _classify_bone(bone)
+    for bone in (*STANDARD_BONES, *_FINGER_CANDIDATES["right"], *_FINGER_CANDIDATES["left"])
+}
+
+# Expression fallback mappings
+_EXPR_FALLBACKS: Dict[str, Tuple[str, ...]] = {
+    "happy": ("joy", "smile", "pleased", "cheerful"),
+    "sad": ("sorrow", "cry", "depressed", "down"),
+    "angry": ("mad", "irritated", "upset", "furious"),
+    "surprised": ("shock", "amazed", "wow", "astonished"),
+    "neutral": ("default", "rest", "normal"),
+    "blink": ("blink_both", "eye_close"),
+    "look_left": ("eye_left", "gaze_left"),
+    "look_right": ("eye_right", "gaze_right"),
+    "look_up": ("eye_up", "gaze_up"),
+    "look_down": ("eye_down", "gaze_down")
+}
+
+# Inverted fallbacks: alias -> (canonical expression, preference rank)
+_ALIAS_TO_CANONICAL: Dict[str, Tuple[str, int]] = {
+    alias: (canonical, rank)
+    for canonical, aliases in _EXPR_FALLBACKS.items()
+    for rank, alias in enumerate(aliases)
+}
+
+# Bone alternative mappings
+_BONE_ALTERNATIVES: Dict[str, Tuple[str, ...]] = {
+    "rightUpperArm": ("rightArm", "rightShoulder"),
+    "leftUpperArm": ("leftArm", "leftShoulder"),
+    "rightLowerArm": ("rightForearm", "rightElbow"),
+    "leftLowerArm": ("leftForearm", "leftElbow"),
+    "spine": ("chest", "upperChest", "torso"),
+    "neck": ("head", "spine"),
+    "rightHand": ("rightWrist",),
+    "leftHand": ("leftWrist",)
+}
+
 def get_model_capabilities(expressions: List[str] = None, bones: List[str] = None) -> VRMCapabilities:
     """
     Analyze or set VRM model capabilities.
@@ -108,16 +216,19 @@ def get_model_capabilities(expressions: List[str] = None, bones: List[str] = Non
         expressions = STANDARD_EXPRESSIONS
     if bones is None:
         bones = STANDARD_BONES
+        bone_lookup = STANDARD_BONES_FS
+    else:
+        # Only four lookups follow, so scanning the list beats building a set
+        bone_lookup = bones
         
     return VRMCapabilities(
         expressions=expressions,
         bones=bones,
-        has_finger_bones="leftThumb1" in bones or "rightThumb1" in bones,
-        has_toe_bones="leftToes" in bones or "rightToes" in bones,
+        has_finger_bones="leftThumb1" in bone_lookup or "rightThumb1" in bone_lookup,
+        has_toe_bones="leftToes" in bone_lookup or "rightToes" in bone_lookup,
         has_spring_bones=True  # Assume spring bone support
     )
 
-@mcp.tool()
 def generate_vrm_action(request: ActionRequest) -> VRMAction:
     """
     Generate a VRM action based on the request and model capabilities.
@@ -130,48 +241,58 @@ def generate_vrm_action(request: ActionRequest) -> VRMAction:
     
     capabilities = request.model_capabilities
     
+    # A single action does only a handful of lookups, so scanning the lists is
+    # cheaper than building sets; get_action_sequence shares sets across actions
+    raw = _build_vrm_action_raw(request, capabilities.expressions, capabilities.bones)
+    
+    # Validating the plain dict in pydantic-core is cheaper than nested model_construct,
+    # and FastMCP passes the resulting instance through without re-validating it
+    return VRMAction.model_validate(raw)
+
+def _build_vrm_action_raw(request: ActionRequest, available_exprs: Collection[str], available_bones: Collection[str]) -> Dict[str, Any]:
+    """Build an action as the plain dict shape of VRMAction"""
+    capabilities = request.model_capabilities
+    
     # Get base template or generate dynamic action
-    template = ACTION_TEMPLATES.get(request.action_type, {})
+    template = _TEMPLATES.get(request.action_type, _NO_TEMPLATE)
     
     # Smart expression mapping with fallbacks
     expressions = []
-    for expr_data in template.get("expressions", []):
-        mapped_expr = _map_expression_with_fallback(expr_data["name"], capabilities.expressions)
+    for expr_name, expr_value in template.expressions:
+        mapped_expr = _map_expression_with_fallback(expr_name, available_exprs)
         if mapped_expr:
-            adjusted_value = expr_data["value"] * request.intensity
-            expressions.append(ExpressionData(name=mapped_expr, value=adjusted_value))
+            adjusted_value = expr_value * request.intensity
+            expressions.append({"name": mapped_expr, "value": adjusted_value})
     
     # Smart bone mapping with alternatives
     bone_transforms = []
-    for bone_data in template.get("bone_transforms", []):
-        mapped_bones = _map_bone_with_alternatives(bone_data["bone_name"], capabilities.bones, capabilities)
+    for target_bone, base_rotation, position in template.bone_transforms:
+        mapped_bones = _map_bone_with_alternatives(target_bone, available_bones, capabilities)
         for bone_name in mapped_bones:
             # Adjust rotation intensity and adapt for bone type
-            rotation = _adapt_rotation_for_bone(bone_data["rotation"], bone_name, request.intensity)
-            bone_transforms.append(BoneTransform(
-                bone_name=bone_name,
-                rotation=rotation,
-                position=bone_data.get("position")
-            ))
+            rotation = _adapt_rotation_for_bone(base_rotation, bone_name, request.intensity)
+            bone_transforms.append({
+                "bone_name": bone_name,
+                "rotation": rotation,
+                "position": position
+            })
     
     # Generate additional actions based on unique model capabilities
-    if not template:
-        bone_transforms.extend(_generate_fallback_action(request, capabilities))
+    if template is _NO_TEMPLATE:
+        bone_transforms.extend(_generate_fallback_action(request, available_bones))
     
-    return VRMAction(
-        name=f"{request.action_type}_{request.intensity}",
-        duration=request.duration,
-        expressions=expressions,
-        bone_transforms=bone_transforms,
-        loop=request.action_type in ["dance_basic", "idle_animation"]
-    )
+    return {
+        "name": f"{request.action_type}_{request.intensity}",
+        "duration": request.duration,
+        "expressions": expressions,
+        "bone_transforms": bone_transforms,
+        "loop": request.action_type in ["dance_basic", "idle_animation"]
+    }
 
-@mcp.tool()
 def list_available_actions() -> List[str]:
     """List all available action types"""
     return list(ACTION_TEMPLATES.keys())
 
-@mcp.tool()
 def create_custom_action(
     name: str,
     expressions: List[Dict] = None,
@@ -195,6 +316,8 @@ def create_custom_action(
         for bone in bone_transforms:
             bone_list.append(BoneTransform(**bone))
     
+    # name/duration/loop come from the caller and are validated here; the
+    # already-validated items are passed through without re-validation
     return VRMAction(
         name=name,
         duration=duration,
@@ -203,72 +326,64 @@ def create_custom_action(
         loop=loop
     )
 
-@mcp.tool()
 def get_action_sequence(action_names: List[str], model_capabilities: VRMCapabilities = None) -> List[VRMAction]:
     """
     Generate a sequence of VRM actions that can be played consecutively.
     """
-    sequence = []
-    for action_name in action_names:
+    if not action_names:
+        return []
+    if model_capabilities is None:
+        raise ValueError("Model capabilities must be provided for accurate action generation")
+    
+    # Capabilities are shared by every action, so validate and resolve them once
+    model_capabilities = VRMCapabilities.model_validate(model_capabilities)
+    expr_set = frozenset(model_capabilities.expressions)
+    bone_set = frozenset(model_capabilities.bones)
+    
+    sequence = [None] * len(action_names)
+    for i, action_name in enumerate(action_names):
         request = ActionRequest(
             action_type=action_name,
             intensity=0.7,
             model_capabilities=model_capabilities
         )
-        action = generate_vrm_action(request)
-        sequence.append(action)
+        sequence[i] = VRMAction.model_validate(_build_vrm_action_raw(request, expr_set, bone_set))
     
     return sequence
 
 # Smart mapping functions for model-specific adaptation
-def _map_expression_with_fallback(target_expr: str, available_exprs: List[str]) -> Optional[str]:
+def _map_expression_with_fallback(target_expr: str, available_exprs: Collection[str]) -> Optional[str]:
     """Map target expression to available expressions with intelligent fallbacks"""
     if target_expr in available_exprs:
         return target_expr
     
-    # Expression fallback mappings
-    fallback_map = {
-        "happy": ["joy", "smile", "pleased", "cheerful"],
-        "sad": ["sorrow", "cry", "depressed", "down"],
-        "angry": ["mad", "irritated", "upset", "furious"],
-        "surprised": ["shock", "amazed", "wow", "astonished"],
-        "neutral": ["default", "rest", "normal"],
-        "blink": ["blink_both", "eye_close"],
-        "look_left": ["eye_left", "gaze_left"],
-        "look_right": ["eye_right", "gaze_right"],
-        "look_up": ["eye_up", "gaze_up"],
-        "look_down": ["eye_down", "gaze_down"]
-    }
-    
-    # Try fallbacks
-    for fallback in fallback_map.get(target_expr, []):
-        if fallback in available_exprs:
-            return fallback
-    
-    return None
+    # Try fallbacks; a set shared across a sequence resolves all aliases once
+    if isinstance(available_exprs, frozenset):
+        return _expression_fallbacks_for(available_exprs).get(target_expr)
+    return next((f for f in _EXPR_FALLBACKS.get(target_expr, ()) if f in available_exprs), None)
 
-def _map_bone_with_alternatives(target_bone: str, available_bones: List[str], capabilities: VRMCapabilities) -> List[str]:
+@lru_cache(maxsize=64)
+def _expression_fallbacks_for(available_exprs: FrozenSet[str]) -> Dict[str, str]:
+    """Best available alias per canonical expression, resolved once per model"""
+    best: Dict[str, Tuple[int, str]] = {}
+    for name in available_exprs:
+        hit = _ALIAS_TO_CANONICAL.get(name)
+        if hit is not None:
+            canonical, rank = hit
+            if canonical not in best or rank < best[canonical][0]:
+                best[canonical] = (rank, name)
+    return {canonical: name for canonical, (_, name) in best.items()}
+
+def _map_bone_with_alternatives(target_bone: str, available_bones: Collection[str], capabilities: VRMCapabilities) -> List[str]:
     """Map target bone to available bones with alternatives and enhancements"""
     mapped_bones = []
     
     if target_bone in available_bones:
         mapped_bones.append(target_bone)
     
-    # Bone alternative mappings
-    bone_alternatives = {
-        "rightUpperArm": ["rightArm", "rightShoulder"],
-        "leftUpperArm": ["leftArm", "leftShoulder"],
-        "rightLowerArm": ["rightForearm", "rightElbow"],
-        "leftLowerArm": ["leftForearm", "leftElbow"],
-        "spine": ["chest", "upperChest", "torso"],
-        "neck": ["head", "spine"],
-        "rightHand": ["rightWrist"],
-        "leftHand": ["leftWrist"]
-    }
-    
     # Try alternatives if main bone not found
     if not mapped_bones:
-        for alt_bone in bone_alternatives.get(target_bone, []):
+        for alt_bone in _BONE_ALTERNATIVES.get(target_bone, ()):
             if alt_bone in available_bones:
                 mapped_bones.append(alt_bone)
                 break
@@ -280,82 +395,119 @@ def _map_bone_with_alternatives(target_bone: str, available_bones: List[str], ca
     
     return mapped_bones
 
-def _get_finger_bones(hand_bone: str, available_bones: List[str]) -> List[str]:
+def _get_finger_bones(hand_bone: str, available_bones: Collection[str]) -> List[str]:
     """Get available finger bones for enhanced hand gestures"""
-    finger_bones = []
-    hand_prefix = "right" if "right" in hand_bone.lower() else "left"
-    
-    finger_names = ["Thumb", "Index", "Middle", "Ring", "Little"]
-    for finger in finger_names:
-        for i in [1, 2, 3]:  # finger segments
-            bone_name = f"{hand_prefix}{finger}{i}"
-            if bone_name in available_bones:
-                finger_bones.append(bone_name)
-    
-    return finger_bones
+    hand_prefix = "right" if hand_bone.startswith("right") else "left"
+    return [b for b in _FINGER_CANDIDATES[hand_prefix] if b in available_bones]
 
-def _adapt_rotation_for_bone(base_rotation: List[float], bone_name: str, intensity: float) -> List[float]:
+def _adapt_rotation_for_bone(base_rotation: Tuple[float, float, float], bone_name: str, intensity: float) -> Tuple[float, float, float]:
     """Adapt rotation values based on bone type and model constraints"""
     # Scale by intensity
-    adapted = [r * intensity for r in base_rotation]
+    x, y, z = base_rotation
+    x *= intensity
+    y *= intensity
+    z *= intensity
     
     # Bone-specific constraints and adjustments
-    if "finger" in bone_name.lower() or "thumb" in bone_name.lower():
+    category = _BONE_CATEGORY.get(bone_name)
+    if category is None:
+        category = _classify_bone(bone_name)
+    
+    if category == _BONE_FINGER:
         # Fingers have limited rotation ranges
-        adapted = [max(-0.5, min(0.5, r)) for r in adapted]
-    elif "neck" in bone_name.lower():
+        x = max(-0.5, min(0.5, x))
+        y = max(-0.5, min(0.5, y))
+        z = max(-0.5, min(0.5, z))
+    elif category == _BONE_NECK:
         # Neck has different constraints
-        adapted[0] = max(-0.8, min(0.8, adapted[0]))  # Limit pitch
-        adapted[1] = max(-1.2, min(1.2, adapted[1]))  # Limit yaw
-    elif "spine" in bone_name.lower():
+        x = max(-0.8, min(0.8, x))  # Limit pitch
+        y = max(-1.2, min(1.2, y))  # Limit yaw
+    elif category == _BONE_SPINE:
         # Spine bending limits
-        adapted[0] = max(-1.0, min(1.0, adapted[0]))
+        x = max(-1.0, min(1.0, x))
     
-    return adapted
+    return (x, y, z)
 
-def _generate_fallback_action(request: ActionRequest, capabilities: VRMCapabilities) -> List[BoneTransform]:
+def _generate_fallback_action(request: ActionRequest, available_bones: Collection[str]) -> List[Dict[str, Any]]:
     """Generate fallback actions when no template exists, using available bones creatively"""
-    fallback_transforms = []
-    
     action_type = request.action_type.lower()
     intensity = request.intensity
     
     # Generate based on action type keywords
     if "wave" in action_type or "hello" in action_type:
-        if "rightUpperArm" in capabilities.bones:
-            fallback_transforms.append(BoneTransform(
-                bone_name="rightUpperArm",
-                rotation=[0, 0, -1.57 * intensity]
-            ))
-    
+        return _fallback_wave(intensity, available_bones)
     elif "dance" in action_type or "move" in action_type:
-        # Use available bones for dance-like movement
-        if "spine" in capabilities.bones:
-            fallback_transforms.append(BoneTransform(
-                bone_name="spine",
-                rotation=[0, 0.3 * intensity, 0]
-            ))
-        for arm in ["rightUpperArm", "leftUpperArm"]:
-            if arm in capabilities.bones:
-                side_mult = 1 if "right" in arm else -1
-                fallback_transforms.append(BoneTransform(
-                    bone_name=arm,
-                    rotation=[0, 0, side_mult * 1.0 * intensity]
-                ))
-    
+        return _fallback_dance(intensity, available_bones)
     elif "point" in action_type or "indicate" in action_type:
-        if "rightUpperArm" in capabilities.bones:
-            fallback_transforms.append(BoneTransform(
-                bone_name="rightUpperArm",
-                rotation=[0, -0.5 * intensity, -1.2 * intensity]
-            ))
-    
+        return _fallback_point(intensity, available_bones)
+    return []
+
+def _fallback_wave(intensity: float, available_bones: Collection[str]) -> List[Dict[str, Any]]:
+    """Raise the right arm for wave/hello style actions"""
+    fallback_transforms = []
+    if "rightUpperArm" in available_bones:
+        fallback_transforms.append({
+            "bone_name": "rightUpperArm",
+            "rotation": (0.0, 0.0, -1.57 * intensity)
+        })
     return fallback_transforms
 
+def _fallback_dance(intensity: float, available_bones: Collection[str]) -> List[Dict[str, Any]]:
+    """Use available bones for dance-like movement"""
+    fallback_transforms = []
+    if "spine" in available_bones:
+        fallback_transforms.append({
+            "bone_name": "spine",
+            "rotation": (0.0, 0.3 * intensity, 0.0)
+        })
+    for arm in ["rightUpperArm", "leftUpperArm"]:
+        if arm in available_bones:
+            side_mult = _BONE_SIDE[arm]
+            fallback_transforms.append({
+                "bone_name": arm,
+                "rotation": (0.0, 0.0, side_mult * 1.0 * intensity)
+            })
+    return fallback_transforms
+
+def _fallback_point(intensity: float, available_bones: Collection[str]) -> List[Dict[str, Any]]:
+    """Extend the right arm for point/indicate style actions"""
+    fallback_transforms = []
+    if "rightUpperArm" in available_bones:
+        fallback_transforms.append({
+            "bone_name": "rightUpperArm",
+            "rotation": (0.0, -0.5 * intensity, -1.2 * intensity)
+        })
+    return fallback_transforms
+
+def _register_tools(mcp: "FastMCP") -> None:
+    """Register the VRM action tools on an MCP server"""
+    for tool in (
+        get_model_capabilities,
+        generate_vrm_action,
+        list_available_actions,
+        create_custom_action,
+        get_action_sequence,
+    ):
+        mcp.tool()(tool)
+
+@cache
+def _create_server() -> "FastMCP":
+    """Build the MCP server on first use so importing this module stays cheap"""
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP("VRM_ActionServer")
+    _register_tools(mcp)
+    return mcp
+
+def __getattr__(name: str):
+    # Keep `main.mcp` available (e.g. for `mcp dev main.py`) without eager construction
+    if name == "mcp":
+        return _create_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def main():
     """Run the MCP server"""
-    mcp.run(transport="stdio")
+    _create_server().run(transport="stdio")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file